@@ -6,18 +6,150 @@ This program connects to JIRA via REST API and generates analytical reports
 based on the provided requirements.
 """
 
+import os
 import requests
-import json
+import orjson
+import itertools
+import concurrent.futures
 import pandas as pd
+import matplotlib
+# Reports are written to PNG files, so render off-screen unless plots should also be shown
+if not os.getenv('JIRA_SHOW_PLOTS'):
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime, timedelta
-from dateutil import parser
+from datetime import datetime
 import numpy as np
+from numba import njit
 import sys
-import os
+import re
+import argparse
+import hashlib
+import math
+import time
+import threading
+import random
+from email.utils import parsedate_to_datetime
 from typing import Dict, List, Tuple, Optional
-from collections import defaultdict
+
+
+# Retry policy for JIRA requests
+MAX_RETRIES = 5
+MAX_BACKOFF_SECONDS = 60
+# Seconds to wait for a connection or for the next chunk of a response before retrying
+REQUEST_TIMEOUT_SECONDS = 30
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# JIRA always returns timestamps in this ISO 8601 form, e.g. 2024-01-02T15:04:05.000+0000
+_JIRA_DT_FMT = "%Y-%m-%dT%H:%M:%S.%f%z"
+_parse = datetime.strptime
+_NS_PER_DAY = 24 * 3600 * 10**9
+
+# Statuses whose name contains any of these words count as closed
+_CLOSED_STATUS_PATTERN = 'closed|resolved|done'
+_CLOSED_STATUS_RE = re.compile(_CLOSED_STATUS_PATTERN, re.IGNORECASE)
+
+# pyplot's figure registry is global state; reports only touch it while holding this lock
+_pyplot_lock = threading.Lock()
+# Serializes output from worker threads so messages are never interleaved mid-line
+_print_lock = threading.Lock()
+
+
+def _log(message: str) -> None:
+    """
+    Print a message as a whole line, safely from any thread.
+    
+    Args:
+        message (str): Message to print
+    """
+    with _print_lock:
+        print(message, flush=True)
+
+
+def _to_ns_array(timestamps: List[str]) -> np.ndarray:
+    """
+    Convert JIRA timestamp strings to integer nanoseconds since the epoch.
+    
+    All strings are parsed in a single vectorized pd.to_datetime call.
+    
+    Args:
+        timestamps (List[str]): Timestamps in JIRA's ISO 8601 format
+        
+    Returns:
+        np.ndarray: int64 nanoseconds since 1970-01-01 UTC
+    """
+    parsed = pd.to_datetime(pd.Index(timestamps, dtype=object), format=_JIRA_DT_FMT, utc=True, cache=True)
+    return parsed.to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+
+# Not parallel=True: reports run in worker threads, where launching numba's parallel
+# backend is unsafe; nogil lets the kernel overlap with the other reports instead
+@njit(nogil=True, cache=True)
+def _time_in_status_kernel(offsets, ts, from_s, to_s, created_ts, updated_ts, closed_status, n_statuses):
+    """
+    Accumulate the days each issue spent in each status.
+    
+    Transitions of issue i occupy rows offsets[i]:offsets[i + 1] of the
+    ts/from_s/to_s arrays, sorted by timestamp. Status ids of -1 mean the
+    status was empty.
+    
+    Returns:
+        np.ndarray: (n_issues, n_statuses) days per status, NaN where the status was never left or closed in
+    """
+    n_issues = offsets.shape[0] - 1
+    out = np.full((n_issues, n_statuses), np.nan)
+    for i in range(n_issues):
+        start = offsets[i]
+        end = offsets[i + 1]
+        if start == end:
+            continue
+        
+        status_start = created_ts[i]
+        current = -1
+        for j in range(start, end):
+            prev = from_s[j]
+            if prev >= 0:
+                if np.isnan(out[i, prev]):
+                    out[i, prev] = 0.0
+                out[i, prev] += (ts[j] - status_start) / _NS_PER_DAY
+            status_start = ts[j]
+            current = to_s[j]
+        
+        # Handle the final status (until issue was closed)
+        if current >= 0 and closed_status[current]:
+            if np.isnan(out[i, current]):
+                out[i, current] = 0.0
+            out[i, current] += (updated_ts[i] - status_start) / _NS_PER_DAY
+    return out
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """
+    Parse the Retry-After header of a response.
+    
+    The wait is capped at MAX_BACKOFF_SECONDS, so an unreasonable header
+    cannot stall the tool.
+    
+    Args:
+        response (requests.Response): Response with a retryable status code
+        
+    Returns:
+        Optional[float]: Seconds to wait, or None if the header is missing or invalid
+    """
+    retry_after = response.headers.get('Retry-After')
+    if not retry_after:
+        return None
+    try:
+        seconds = float(retry_after)
+    except ValueError:
+        seconds = None
+    if seconds is not None:
+        return min(MAX_BACKOFF_SECONDS, max(0.0, seconds))
+    # Retry-After may also be an HTTP date
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return min(MAX_BACKOFF_SECONDS, max(0.0, retry_at.timestamp() - time.time()))
 
 
 class JiraAnalytics:
@@ -25,7 +157,7 @@ class JiraAnalytics:
     A class to connect to JIRA via REST API and generate analytical reports.
     """
     
-    def __init__(self, jira_url: str, username: str, api_token: str):
+    def __init__(self, jira_url: str, username: str, api_token: str, max_workers: int = 16):
         """
         Initialize the JiraAnalytics class with connection parameters.
         
@@ -33,32 +165,85 @@ class JiraAnalytics:
             jira_url (str): Base URL of the JIRA instance
             username (str): JIRA username
             api_token (str): JIRA API token
+            max_workers (int): Maximum number of concurrent requests to JIRA
         """
         self.jira_url = jira_url.rstrip('/')
+        self.max_workers = max_workers
+        # Changelogs fetched separately for issues that came without one, by issue key
+        self._changelog_cache: Dict[str, Dict] = {}
         self.auth = (username, api_token)
-        self.session = requests.Session()
+        self.session = self._create_session()
         self.session.auth = self.auth
-        self.session.headers.update({'Content-Type': 'application/json'})
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept-Encoding': 'gzip'
+        })
+        # Size the connection pool to match the worker count so connections are reused
+        adapter = requests.adapters.HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+    def _create_session(self) -> requests.Session:
+        """
+        Create the HTTP session used for all JIRA requests.
         
+        When the JIRA_CACHE environment variable is set to 1, responses are cached
+        on disk (SQLite, one hour) with requests_cache so repeated runs skip the
+        network; stale entries are served if JIRA returns an error.
+        
+        Returns:
+            requests.Session: Plain or caching session
+        """
+        if os.getenv('JIRA_CACHE') == '1':
+            try:
+                from requests_cache import CachedSession
+            except ImportError:
+                print("JIRA_CACHE is set but requests_cache is not installed, caching disabled.")
+            else:
+                return CachedSession('jira_cache', backend='sqlite', expire_after=3600, stale_if_error=True)
+        return requests.Session()
+    
     def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
         """
         Make a request to the JIRA API.
         
+        Rate-limited (429) and transient server errors, as well as connections
+        that stall for REQUEST_TIMEOUT_SECONDS, are retried up to MAX_RETRIES
+        times, honouring the Retry-After header when present and otherwise
+        backing off exponentially with jitter.
+        
         Args:
             endpoint (str): API endpoint
             params (Dict): Request parameters
             
         Returns:
             Dict: JSON response from the API
+            
+        Raises:
+            requests.exceptions.RequestException: If the request still fails after all retries
         """
         url = f"{self.jira_url}{endpoint}"
-        try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error making request to {url}: {e}")
-            return {}
+        for attempt in range(MAX_RETRIES):
+            delay = None
+            try:
+                response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT_SECONDS)
+                if response.status_code in RETRY_STATUS_CODES:
+                    delay = _retry_after_seconds(response)
+                response.raise_for_status()
+                # orjson decodes large search pages much faster than the stdlib json module
+                return orjson.loads(response.content)
+            except (requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                    requests.exceptions.HTTPError) as e:
+                retryable = not isinstance(e, requests.exceptions.HTTPError) or \
+                    e.response.status_code in RETRY_STATUS_CODES
+                if not retryable or attempt == MAX_RETRIES - 1:
+                    _log(f"Error making request to {url}: {e}")
+                    raise
+                if delay is None:
+                    delay = min(MAX_BACKOFF_SECONDS, 2 ** attempt + random.uniform(0, 1))
+                _log(f"Request to {url} failed ({e}), retrying in {delay:.1f}s...")
+                time.sleep(delay)
     
     def get_issues_by_project(self, project_key: str, max_results: int = 1000) -> List[Dict]:
         """
@@ -74,43 +259,58 @@ class JiraAnalytics:
         jql = f"project = '{project_key}' ORDER BY created DESC"
         params = {
             'jql': jql,
+            'startAt': 0,
             'maxResults': max_results,
-            'fields': 'key,summary,status,created,updated,assignee,reporter,priority,timetracking,issuetype'
+            # Only the fields used by the reports; the issue key is always returned
+            'fields': 'status,created,updated,assignee,reporter,priority,timetracking',
+            # Embed the changelog in the search results to avoid one request per issue
+            'expand': 'changelog'
         }
         
-        # Get total number of issues first
-        response = self._make_request('/rest/api/2/search', {'jql': jql, 'maxResults': 0})
-        total_issues = response.get('total', 0)
+        # Changelogs fetched for earlier results may be stale by now
+        self._changelog_cache.clear()
         
-        # Now fetch all issues in batches
+        # Fetch all issues in batches; each page reports the total, so no separate count request is needed
         all_issues = []
-        start_at = 0
         
-        while start_at < total_issues:
-            params['startAt'] = start_at
+        while True:
             response = self._make_request('/rest/api/2/search', params)
             issues = response.get('issues', [])
             all_issues.extend(issues)
-            start_at += max_results
+            
+            if not issues or len(all_issues) >= response.get('total', 0):
+                break
+            # JIRA may cap maxResults below the requested value, so advance by what was returned
+            params['startAt'] = len(all_issues)
             
         return all_issues
     
-    def get_issue_transitions(self, issue_key: str) -> List[Dict]:
+    def get_issue_transitions(self, issue: Dict) -> List[Dict]:
         """
         Get transition history for a specific issue.
         
+        The changelog is read from the issue itself when it was fetched with
+        'expand=changelog'; otherwise it is requested from JIRA once per issue
+        key and cached until the next project fetch.
+        
         Args:
-            issue_key (str): Issue key (e.g., 'KAFKA-1234')
+            issue (Dict): JIRA issue data
             
         Returns:
             List[Dict]: List of transitions with timestamps
         """
-        response = self._make_request(f'/rest/api/2/issue/{issue_key}', {
-            'expand': 'changelog'
-        })
+        issue_key = issue['key']
+        changelog = issue.get('changelog')
+        if changelog is None:
+            changelog = self._changelog_cache.get(issue_key)
+        if changelog is None:
+            response = self._make_request(f'/rest/api/2/issue/{issue_key}', {
+                'expand': 'changelog'
+            })
+            changelog = response.get('changelog', {})
+            self._changelog_cache[issue_key] = changelog
         
         transitions = []
-        changelog = response.get('changelog', {})
         histories = changelog.get('histories', [])
         
         for history in histories:
@@ -128,6 +328,42 @@ class JiraAnalytics:
         transitions.sort(key=lambda x: x['timestamp'])
         return transitions
     
+    def _issues_to_dataframe(self, issues: List[Dict]) -> pd.DataFrame:
+        """
+        Convert a list of JIRA issues into a DataFrame for vectorized analysis.
+        
+        Args:
+            issues (List[Dict]): List of JIRA issues
+            
+        Returns:
+            pd.DataFrame: One row per issue with 'key', 'created', 'updated', 'status_name',
+            'assignee', 'reporter', 'priority', 'time_spent_seconds' and 'transitions'
+            columns, plus an 'is_closed' status mask
+        """
+        def display_name(user: Optional[Dict]) -> Optional[str]:
+            return user.get('displayName') if user else None
+        
+        fields = [issue['fields'] for issue in issues]
+        df = pd.DataFrame({
+            'key': pd.Series([issue['key'] for issue in issues], dtype=object),
+            'created': pd.Series([f['created'] for f in fields], dtype=object),
+            'updated': pd.Series([f['updated'] for f in fields], dtype=object),
+            'status_name': pd.Series([f['status']['name'] for f in fields], dtype=object),
+            'assignee': pd.Series([display_name(f.get('assignee')) for f in fields], dtype=object),
+            'reporter': pd.Series([display_name(f.get('reporter')) for f in fields], dtype=object),
+            'priority': pd.Series([(f.get('priority') or {}).get('name', 'Unknown') for f in fields], dtype=object),
+            'time_spent_seconds': pd.Series([(f.get('timetracking') or {}).get('timeSpentSeconds') for f in fields], dtype=np.float64),
+            'transitions': pd.Series(self._transitions_by_issue(issues), dtype=object)
+        })
+        # cache=True parses each distinct timestamp string only once
+        df['created'] = pd.to_datetime(df['created'], format=_JIRA_DT_FMT, utc=True, cache=True)
+        df['updated'] = pd.to_datetime(df['updated'], format=_JIRA_DT_FMT, utc=True, cache=True)
+        # Few distinct statuses repeat across many issues, so store them as a categorical
+        df['status_name'] = df['status_name'].astype('category')
+        # Computed once here so downstream filters never re-check status names
+        df['is_closed'] = df['status_name'].str.contains(_CLOSED_STATUS_PATTERN, case=False, regex=True, na=False).astype(bool)
+        return df
+    
     def calculate_open_duration(self, issue: Dict) -> Optional[float]:
         """
         Calculate the duration a task was open (from creation to closure).
@@ -139,21 +375,38 @@ class JiraAnalytics:
             Optional[float]: Duration in days, or None if not closed
         """
         created_str = issue['fields']['created']
-        created = parser.parse(created_str)
+        created = _parse(created_str, _JIRA_DT_FMT)
         
         # Check if the issue is closed by looking at status
-        status_name = issue['fields']['status']['name'].lower()
-        if 'closed' not in status_name and 'resolved' not in status_name and 'done' not in status_name:
+        if not _CLOSED_STATUS_RE.search(issue['fields']['status']['name']):
             return None  # Not a closed issue
         
         # Find the actual closed date from transitions if possible
         # For now, we'll use the updated date as the closed date
         updated_str = issue['fields']['updated']
-        updated = parser.parse(updated_str)
+        updated = _parse(updated_str, _JIRA_DT_FMT)
         
         duration = (updated - created).total_seconds() / (24 * 3600)  # Convert to days
         return duration
     
+    def _transitions_by_issue(self, issues: List[Dict]) -> List[List[Dict]]:
+        """
+        Get the transition history of every issue, in issue order.
+        
+        Args:
+            issues (List[Dict]): List of issues
+            
+        Returns:
+            List[List[Dict]]: Transitions of each issue
+        """
+        # Issues from get_issues_by_project already carry their changelog
+        if all('changelog' in issue for issue in issues):
+            return [self.get_issue_transitions(issue) for issue in issues]
+        
+        # Changelog fetches are I/O bound, so run them concurrently over the shared session
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.get_issue_transitions, issues))
+    
     def get_all_transitions_for_project(self, project_key: str, issues: List[Dict]) -> List[Dict]:
         """
         Get all transitions for all issues in a project.
@@ -165,11 +418,23 @@ class JiraAnalytics:
         Returns:
             List[Dict]: All transitions for the project
         """
-        all_transitions = []
-        for issue in issues:
-            transitions = self.get_issue_transitions(issue['key'])
-            all_transitions.extend(transitions)
-        return all_transitions
+        return list(itertools.chain.from_iterable(self._transitions_by_issue(issues)))
+    
+    def calculate_open_durations(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Calculate the open duration of all closed issues at once.
+        
+        Vectorized equivalent of calculate_open_duration over an issues DataFrame.
+        
+        Args:
+            df (pd.DataFrame): Issues DataFrame from _issues_to_dataframe
+            
+        Returns:
+            np.ndarray: Durations in days of the closed issues
+        """
+        closed = df[df['is_closed']]
+        durations = (closed['updated'] - closed['created']) / np.timedelta64(1, 'D')
+        return durations.to_numpy(dtype=np.float64)
     
     def calculate_time_in_status(self, issue: Dict) -> Dict[str, float]:
         """
@@ -181,12 +446,12 @@ class JiraAnalytics:
         Returns:
             Dict[str, float]: Time spent in each status (in days)
         """
-        transitions = self.get_issue_transitions(issue['key'])
+        transitions = self.get_issue_transitions(issue)
         if not transitions:
             return {}
         
         # Get the creation time as the starting point
-        created = parser.parse(issue['fields']['created'])
+        created = _parse(issue['fields']['created'], _JIRA_DT_FMT)
         time_in_status = {}
         
         # Start with the initial status
@@ -195,7 +460,7 @@ class JiraAnalytics:
         
         # Process each transition
         for transition in transitions:
-            transition_time = parser.parse(transition['timestamp'])
+            transition_time = _parse(transition['timestamp'], _JIRA_DT_FMT)
             
             # Add time spent in the previous status
             if transition['from_status']:
@@ -209,8 +474,8 @@ class JiraAnalytics:
             current_status = transition['to_status']
         
         # Handle the final status (until issue was closed)
-        if 'closed' in current_status.lower() or 'resolved' in current_status.lower() or 'done' in current_status.lower():
-            updated = parser.parse(issue['fields']['updated'])
+        if _CLOSED_STATUS_RE.search(current_status):
+            updated = _parse(issue['fields']['updated'], _JIRA_DT_FMT)
             final_time_spent = (updated - status_start_time).total_seconds() / (24 * 3600)
             if current_status not in time_in_status:
                 time_in_status[current_status] = 0
@@ -218,107 +483,200 @@ class JiraAnalytics:
         
         return time_in_status
     
-    def generate_open_duration_histogram(self, issues: List[Dict]) -> None:
+    def calculate_time_in_status_matrix(self, df: pd.DataFrame) -> Tuple[np.ndarray, List[str]]:
+        """
+        Calculate time spent in each status for all issues at once.
+        
+        Transitions are packed into contiguous arrays (one slice per issue) with
+        status names interned to integer codes, their timestamps are parsed in one
+        vectorized pass, and the result is processed by a compiled kernel.
+        
+        Args:
+            df (pd.DataFrame): Issues DataFrame from _issues_to_dataframe
+            
+        Returns:
+            Tuple[np.ndarray, List[str]]: (n_issues, n_statuses) matrix of days spent in
+            each status (NaN where not applicable) and the status name of each column
+        """
+        # Flatten the transitions of all issues into contiguous columns, one slice per issue
+        offsets = np.zeros(len(df) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(transitions) for transitions in df['transitions']])
+        flat = list(itertools.chain.from_iterable(df['transitions']))
+        ts = [transition['timestamp'] for transition in flat]
+        
+        # Intern from/to status names to int16 codes in a single factorize pass;
+        # empty statuses become missing values, which factorize codes as -1
+        statuses = pd.Series(
+            [transition['from_status'] or None for transition in flat] +
+            [transition['to_status'] or None for transition in flat],
+            dtype=object
+        )
+        codes, uniques = pd.factorize(statuses)
+        codes = codes.astype(np.int16)
+        from_s, to_s = codes[:len(flat)], codes[len(flat):]
+        
+        status_names = list(uniques)
+        closed_status = np.asarray(
+            pd.Index(uniques, dtype=object).str.contains(_CLOSED_STATUS_PATTERN, case=False, regex=True),
+            dtype=np.bool_
+        )
+        created_ts = df['created'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+        updated_ts = df['updated'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+        
+        matrix = _time_in_status_kernel(
+            offsets,
+            _to_ns_array(ts),
+            from_s,
+            to_s,
+            created_ts,
+            updated_ts,
+            closed_status,
+            len(status_names)
+        )
+        return matrix, status_names
+    
+    def _create_figure(self, nrows: int = 1, ncols: int = 1, **kwargs):
+        """
+        Create a new report figure and its axes.
+        
+        Reports draw only on the returned objects, never on pyplot's current
+        figure, so several reports can be rendered from different threads.
+        
+        Args:
+            nrows (int): Number of subplot rows
+            ncols (int): Number of subplot columns
+            **kwargs: Passed through to plt.subplots
+            
+        Returns:
+            Tuple[plt.Figure, Any]: The figure and its axes
+        """
+        with _pyplot_lock:
+            return plt.subplots(nrows, ncols, **kwargs)
+    
+    def _save_figure(self, fig: plt.Figure, filename: str) -> None:
+        """
+        Save a report figure to a PNG file and release it.
+        
+        The figure is only shown interactively when JIRA_SHOW_PLOTS is set.
+        
+        Args:
+            fig (plt.Figure): Figure to save
+            filename (str): Output file name
+        """
+        fig.tight_layout()
+        fig.savefig(filename)
+        with _pyplot_lock:
+            if os.getenv('JIRA_SHOW_PLOTS'):
+                plt.show()
+            plt.close(fig)
+    
+    def _plot_histogram(self, ax, values: np.ndarray, bins: int) -> None:
+        """
+        Draw a histogram of values on the given axes.
+        
+        Bins are counted with np.histogram and drawn as bars, which skips the
+        unit handling and per-call conversion done by Axes.hist.
+        
+        Args:
+            ax: Matplotlib axes to draw on
+            values (np.ndarray): Sample values
+            bins (int): Number of equal-width bins
+        """
+        counts, edges = np.histogram(np.asarray(values, dtype=np.float64), bins=bins)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), edgecolor='black', align='edge')
+    
+    def generate_open_duration_histogram(self, df: pd.DataFrame) -> None:
         """
         Generate histogram of time tasks spent in open state.
         
         Args:
-            issues (List[Dict]): List of JIRA issues
+            df (pd.DataFrame): Issues DataFrame from _issues_to_dataframe
         """
-        durations = []
-        for issue in issues:
-            duration = self.calculate_open_duration(issue)
-            if duration is not None:
-                durations.append(duration)
+        durations = self.calculate_open_durations(df)
         
-        if not durations:
-            print("No closed issues found for analysis.")
+        if durations.size == 0:
+            _log("No closed issues found for analysis.")
             return
         
-        plt.figure(figsize=(12, 6))
-        plt.hist(durations, bins=30, edgecolor='black')
-        plt.title('Distribution of Time Tasks Spent in Open State')
-        plt.xlabel('Time in Open State (days)')
-        plt.ylabel('Number of Tasks')
-        plt.grid(axis='y', alpha=0.75)
-        plt.tight_layout()
-        plt.savefig('open_duration_histogram.png')
-        plt.show()
-        print("Open duration histogram saved as 'open_duration_histogram.png'")
+        fig, ax = self._create_figure(figsize=(12, 6))
+        self._plot_histogram(ax, durations, bins=30)
+        ax.set_title('Distribution of Time Tasks Spent in Open State')
+        ax.set_xlabel('Time in Open State (days)')
+        ax.set_ylabel('Number of Tasks')
+        ax.grid(axis='y', alpha=0.75)
+        self._save_figure(fig, 'open_duration_histogram.png')
+        _log("Open duration histogram saved as 'open_duration_histogram.png'")
     
-    def generate_status_time_distribution(self, issues: List[Dict]) -> None:
+    def generate_status_time_distribution(self, df: pd.DataFrame) -> None:
         """
         Generate distribution of time spent in each status.
         
         Args:
-            issues (List[Dict]): List of JIRA issues
+            df (pd.DataFrame): Issues DataFrame from _issues_to_dataframe
         """
-        all_status_times = defaultdict(list)
-        
-        for issue in issues:
-            status_times = self.calculate_time_in_status(issue)
-            for status, time_spent in status_times.items():
-                all_status_times[status].append(time_spent)
+        matrix, status_names = self.calculate_time_in_status_matrix(df)
+        
+        # Convert back to per-status samples only for plotting
+        all_status_times = {}
+        for column, status in enumerate(status_names):
+            times = matrix[:, column]
+            times = times[~np.isnan(times)]
+            if times.size:
+                all_status_times[status] = times
+        
+        if not all_status_times:
+            _log("No status transitions found for analysis.")
+            return
         
-        # Create separate plots for each status
-        fig, axes = plt.subplots(len(all_status_times), 1, figsize=(12, 6*len(all_status_times)))
-        if len(all_status_times) == 1:
-            axes = [axes]
+        # Create separate plots for each status, laid out in a grid of up to three columns
+        ncols = min(3, len(all_status_times))
+        nrows = math.ceil(len(all_status_times) / ncols)
+        fig, axes = self._create_figure(nrows, ncols, figsize=(6*ncols, 4*nrows), squeeze=False)
+        axes = axes.flatten()
         
         for i, (status, times) in enumerate(all_status_times.items()):
-            axes[i].hist(times, bins=20, edgecolor='black')
+            self._plot_histogram(axes[i], times, bins=20)
             axes[i].set_title(f'Time Distribution in Status: {status}')
             axes[i].set_xlabel('Time (days)')
             axes[i].set_ylabel('Number of Tasks')
             axes[i].grid(axis='y', alpha=0.75)
         
-        plt.tight_layout()
-        plt.savefig('status_time_distribution.png')
-        plt.show()
-        print("Status time distribution saved as 'status_time_distribution.png'")
+        # Hide the unused cells of the last row
+        for ax in axes[len(all_status_times):]:
+            ax.set_visible(False)
+        
+        self._save_figure(fig, 'status_time_distribution.png')
+        _log("Status time distribution saved as 'status_time_distribution.png'")
     
-    def generate_daily_task_trend(self, issues: List[Dict]) -> None:
+    def generate_daily_task_trend(self, df: pd.DataFrame) -> None:
         """
         Generate graph showing daily created and closed tasks with cumulative totals.
         
         Args:
-            issues (List[Dict]): List of JIRA issues
+            df (pd.DataFrame): Issues DataFrame from _issues_to_dataframe
         """
-        created_dates = []
-        closed_dates = []
-        
-        for issue in issues:
-            # Add creation date
-            created = parser.parse(issue['fields']['created']).date()
-            created_dates.append(created)
-            
-            # Add closure date if the issue is closed
-            status_name = issue['fields']['status']['name'].lower()
-            if 'closed' in status_name or 'resolved' in status_name or 'done' in status_name:
-                updated = parser.parse(issue['fields']['updated']).date()
-                closed_dates.append(updated)
-        
         # Create date ranges
-        if not created_dates and not closed_dates:
-            print("No issues found for analysis.")
+        if df.empty:
+            _log("No issues found for analysis.")
             return
-            
-        all_dates = set(created_dates + closed_dates)
-        min_date = min(all_dates)
-        max_date = max(all_dates)
         
-        date_range = pd.date_range(start=min_date, end=max_date, freq='D')
+        # Creation dates of all issues, closure (last update) dates of closed issues, in UTC
+        created_idx = pd.DatetimeIndex(df['created'].dt.tz_localize(None).dt.normalize())
+        closed_idx = pd.DatetimeIndex(df.loc[df['is_closed'], 'updated'].dt.tz_localize(None).dt.normalize())
+        all_dates = created_idx.append(closed_idx)
         
-        # Count daily created and closed tasks
-        created_counts = [created_dates.count(date.date()) for date in date_range]
-        closed_counts = [closed_dates.count(date.date()) for date in date_range]
+        date_range = pd.date_range(start=all_dates.min(), end=all_dates.max(), freq='D')
+        
+        # Count daily created and closed tasks in a single hash pass each
+        created_counts = created_idx.value_counts().reindex(date_range, fill_value=0).to_numpy()
+        closed_counts = closed_idx.value_counts().reindex(date_range, fill_value=0).to_numpy()
         
         # Calculate cumulative totals
         cumulative_created = np.cumsum(created_counts)
         cumulative_closed = np.cumsum(closed_counts)
         
         # Create the plot
-        fig, ax = plt.subplots(figsize=(14, 8))
+        fig, ax = self._create_figure(figsize=(14, 8))
         ax.plot(date_range, created_counts, label='Created Daily', marker='o', linestyle='-', alpha=0.7)
         ax.plot(date_range, closed_counts, label='Closed Daily', marker='s', linestyle='-', alpha=0.7)
         ax.plot(date_range, cumulative_created, label='Cumulative Created', linestyle='--', linewidth=2)
@@ -329,181 +687,187 @@ class JiraAnalytics:
         ax.set_ylabel('Number of Tasks')
         ax.legend()
         ax.grid(True, alpha=0.3)
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.savefig('daily_task_trend.png')
-        plt.show()
-        print("Daily task trend saved as 'daily_task_trend.png'")
+        ax.tick_params(axis='x', labelrotation=45)
+        self._save_figure(fig, 'daily_task_trend.png')
+        _log("Daily task trend saved as 'daily_task_trend.png'")
     
-    def generate_user_task_distribution(self, issues: List[Dict], top_n: int = 30) -> None:
+    def generate_user_task_distribution(self, df: pd.DataFrame, top_n: int = 30) -> None:
         """
         Generate graph showing task distribution by user (assignee and reporter).
         
         Args:
-            issues (List[Dict]): List of JIRA issues
+            df (pd.DataFrame): Issues DataFrame from _issues_to_dataframe
             top_n (int): Number of top users to display
         """
-        assignee_counts = defaultdict(int)
-        reporter_counts = defaultdict(int)
-        
-        for issue in issues:
-            # Count assignees
-            assignee = issue['fields'].get('assignee')
-            if assignee and 'displayName' in assignee:
-                assignee_counts[assignee['displayName']] += 1
-            
-            # Count reporters
-            reporter = issue['fields'].get('reporter')
-            if reporter and 'displayName' in reporter:
-                reporter_counts[reporter['displayName']] += 1
-        
-        # Get top N assignees and reporters
-        top_assignees = sorted(assignee_counts.items(), key=lambda x: x[1], reverse=True)[:top_n]
-        top_reporters = sorted(reporter_counts.items(), key=lambda x: x[1], reverse=True)[:top_n]
+        # Get top N assignees and reporters, already sorted by count
+        top_assignees = df['assignee'].value_counts().head(top_n)
+        top_reporters = df['reporter'].value_counts().head(top_n)
         
         # Create subplots
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, 10))
+        fig, (ax1, ax2) = self._create_figure(1, 2, figsize=(20, 10))
         
         # Plot assignees
-        if top_assignees:
-            assignees, counts = zip(*top_assignees)
-            ax1.barh(range(len(assignees)), counts)
-            ax1.set_yticks(range(len(assignees)))
-            ax1.set_yticklabels(assignees)
+        if not top_assignees.empty:
+            ax1.barh(range(len(top_assignees)), top_assignees.to_numpy())
+            ax1.set_yticks(range(len(top_assignees)))
+            ax1.set_yticklabels(top_assignees.index)
             ax1.set_xlabel('Number of Tasks')
             ax1.set_title(f'Top {top_n} Assignees by Task Count')
             ax1.invert_yaxis()
         
         # Plot reporters
-        if top_reporters:
-            reporters, counts = zip(*top_reporters)
-            ax2.barh(range(len(reporters)), counts)
-            ax2.set_yticks(range(len(reporters)))
-            ax2.set_yticklabels(reporters)
+        if not top_reporters.empty:
+            ax2.barh(range(len(top_reporters)), top_reporters.to_numpy())
+            ax2.set_yticks(range(len(top_reporters)))
+            ax2.set_yticklabels(top_reporters.index)
             ax2.set_xlabel('Number of Tasks')
             ax2.set_title(f'Top {top_n} Reporters by Task Count')
             ax2.invert_yaxis()
         
-        plt.tight_layout()
-        plt.savefig('user_task_distribution.png')
-        plt.show()
-        print("User task distribution saved as 'user_task_distribution.png'")
+        self._save_figure(fig, 'user_task_distribution.png')
+        _log("User task distribution saved as 'user_task_distribution.png'")
     
-    def generate_logged_time_histogram(self, issues: List[Dict]) -> None:
+    def generate_logged_time_histogram(self, df: pd.DataFrame) -> None:
         """
         Generate histogram of logged time by users.
         
         Args:
-            issues (List[Dict]): List of JIRA issues
+            df (pd.DataFrame): Issues DataFrame from _issues_to_dataframe
         """
-        user_logged_times = defaultdict(float)  # Total logged time per user in hours
-        
-        for issue in issues:
-            # Check if the issue has timetracking information
-            timetracking = issue['fields'].get('timetracking', {})
-            if 'timeSpentSeconds' in timetracking:
-                time_spent_seconds = timetracking['timeSpentSeconds']
-                time_spent_hours = time_spent_seconds / 3600.0  # Convert to hours
-                
-                # Attribute to the assignee
-                assignee = issue['fields'].get('assignee')
-                if assignee and 'displayName' in assignee:
-                    user_logged_times[assignee['displayName']] += time_spent_hours
-        
-        if not user_logged_times:
-            print("No logged time information found in the issues.")
+        # Total logged time per assignee in hours, for issues with timetracking information
+        logged = df[df['time_spent_seconds'].notna() & df['assignee'].notna()]
+        user_logged_times = logged.groupby('assignee')['time_spent_seconds'].sum() / 3600.0
+        
+        if user_logged_times.empty:
+            _log("No logged time information found in the issues.")
             return
         
-        logged_times = list(user_logged_times.values())
+        logged_times = user_logged_times.to_numpy()
         
-        plt.figure(figsize=(12, 6))
-        plt.hist(logged_times, bins=30, edgecolor='black')
-        plt.title('Distribution of Logged Time by Users')
-        plt.xlabel('Logged Time (hours)')
-        plt.ylabel('Number of Tasks')
-        plt.grid(axis='y', alpha=0.75)
-        plt.tight_layout()
-        plt.savefig('logged_time_histogram.png')
-        plt.show()
-        print("Logged time histogram saved as 'logged_time_histogram.png'")
+        fig, ax = self._create_figure(figsize=(12, 6))
+        self._plot_histogram(ax, logged_times, bins=30)
+        ax.set_title('Distribution of Logged Time by Users')
+        ax.set_xlabel('Logged Time (hours)')
+        ax.set_ylabel('Number of Tasks')
+        ax.grid(axis='y', alpha=0.75)
+        self._save_figure(fig, 'logged_time_histogram.png')
+        _log("Logged time histogram saved as 'logged_time_histogram.png'")
     
-    def generate_priority_distribution(self, issues: List[Dict]) -> None:
+    def generate_priority_distribution(self, df: pd.DataFrame) -> None:
         """
         Generate graph showing task distribution by priority.
         
         Args:
-            issues (List[Dict]): List of JIRA issues
+            df (pd.DataFrame): Issues DataFrame from _issues_to_dataframe
         """
-        priority_counts = defaultdict(int)
+        priority_counts = df['priority'].value_counts()
         
-        for issue in issues:
-            priority = issue['fields'].get('priority', {}).get('name', 'Unknown')
-            priority_counts[priority] += 1
-        
-        if not priority_counts:
-            print("No priority information found in the issues.")
+        if priority_counts.empty:
+            _log("No priority information found in the issues.")
             return
         
-        priorities, counts = zip(*priority_counts.items())
+        priorities = priority_counts.index.tolist()
+        counts = priority_counts.tolist()
         
-        plt.figure(figsize=(12, 6))
-        bars = plt.bar(priorities, counts)
-        plt.title('Task Distribution by Priority')
-        plt.xlabel('Priority')
-        plt.ylabel('Number of Tasks')
-        plt.xticks(rotation=45)
+        fig, ax = self._create_figure(figsize=(12, 6))
+        bars = ax.bar(priorities, counts)
+        ax.set_title('Task Distribution by Priority')
+        ax.set_xlabel('Priority')
+        ax.set_ylabel('Number of Tasks')
+        ax.tick_params(axis='x', labelrotation=45)
         
         # Add value labels on bars
         for bar, count in zip(bars, counts):
-            plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1, 
+            ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1, 
                     str(count), ha='center', va='bottom')
         
-        plt.tight_layout()
-        plt.savefig('priority_distribution.png')
-        plt.show()
-        print("Priority distribution saved as 'priority_distribution.png'")
+        self._save_figure(fig, 'priority_distribution.png')
+        _log("Priority distribution saved as 'priority_distribution.png'")
     
-    def run_full_analysis(self, project_key: str) -> None:
+    def run_full_analysis(self, project_key: str, refresh: bool = False) -> None:
         """
         Run the complete analysis and generate all reports.
         
+        The fetched issues are cached in '<project_key>-<instance>.parquet', where
+        <instance> is a short hash of the JIRA URL, and reused by later runs, so
+        only the first run (or a refresh) queries JIRA. A cache that cannot be
+        read is ignored and the issues are fetched again.
+        
         Args:
             project_key (str): Project key to analyze
+            refresh (bool): Ignore the cached issues and fetch them from JIRA again
         """
         print(f"Starting analysis for project: {project_key}")
         
-        # Get all issues for the project
-        print("Fetching issues from JIRA...")
-        issues = self.get_issues_by_project(project_key)
-        print(f"Fetched {len(issues)} issues")
+        # Tag the cache with the instance so equal project keys on different JIRAs don't collide
+        instance_tag = hashlib.sha1(self.jira_url.encode('utf-8')).hexdigest()[:8]
+        cache_path = f'{project_key}-{instance_tag}.parquet'
+        df = None
+        if not refresh and os.path.exists(cache_path):
+            print(f"Loading issues from cache '{cache_path}'...")
+            try:
+                df = pd.read_parquet(cache_path)
+                # A cache written by an older version may lack columns the reports need
+                missing = set(self._issues_to_dataframe([]).columns) - set(df.columns)
+                if missing:
+                    raise ValueError(f"missing columns {', '.join(sorted(missing))}")
+            except Exception as e:
+                print(f"Could not load cache '{cache_path}' ({e}), fetching from JIRA instead")
+                df = None
+            else:
+                print(f"Loaded {len(df)} issues")
+        
+        if df is None:
+            # Get all issues for the project
+            print("Fetching issues from JIRA...")
+            issues = self.get_issues_by_project(project_key)
+            print(f"Fetched {len(issues)} issues")
+            
+            # Build the DataFrame once; transitions are stored as a nested list column
+            df = self._issues_to_dataframe(issues)
+            # Write to a temporary file first so an interrupted run never leaves a truncated cache
+            tmp_path = f'{cache_path}.tmp'
+            try:
+                df.to_parquet(tmp_path, compression='zstd')
+                os.replace(tmp_path, cache_path)
+            except Exception as e:
+                # The cache only speeds up later runs; never lose a finished fetch over it
+                print(f"Could not cache issues in '{cache_path}': {e}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            else:
+                print(f"Issues cached in '{cache_path}'")
         
         # Filter for closed/resolved issues only for some analyses
-        closed_issues = []
-        for issue in issues:
-            status_name = issue['fields']['status']['name'].lower()
-            if 'closed' in status_name or 'resolved' in status_name or 'done' in status_name:
-                closed_issues.append(issue)
+        closed_df = df[df['is_closed']]
         
-        print(f"Found {len(closed_issues)} closed issues")
+        print(f"Found {len(closed_df)} closed issues")
         
         # Generate all reports
-        print("Generating Open Duration Histogram...")
-        self.generate_open_duration_histogram(closed_issues)
-        
-        print("Generating Status Time Distribution...")
-        self.generate_status_time_distribution(closed_issues)
-        
-        print("Generating Daily Task Trend...")
-        self.generate_daily_task_trend(issues)
-        
-        print("Generating User Task Distribution...")
-        self.generate_user_task_distribution(issues)
-        
-        print("Generating Logged Time Histogram...")
-        self.generate_logged_time_histogram(closed_issues)
-        
-        print("Generating Priority Distribution...")
-        self.generate_priority_distribution(issues)
+        reports = [
+            ('Open Duration Histogram', self.generate_open_duration_histogram, closed_df),
+            ('Status Time Distribution', self.generate_status_time_distribution, closed_df),
+            ('Daily Task Trend', self.generate_daily_task_trend, df),
+            ('User Task Distribution', self.generate_user_task_distribution, df),
+            ('Logged Time Histogram', self.generate_logged_time_histogram, closed_df),
+            ('Priority Distribution', self.generate_priority_distribution, df)
+        ]
+        
+        def run_report(name, generate, data):
+            # Report progress from the worker, when the report actually starts
+            _log(f"Generating {name}...")
+            generate(data)
+        
+        if os.getenv('JIRA_SHOW_PLOTS'):
+            # Interactive backends must be driven from the main thread
+            for report in reports:
+                run_report(*report)
+        else:
+            # Reports are independent and spend most of their time rendering PNGs, so overlap them
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(reports)) as executor:
+                futures = [executor.submit(run_report, *report) for report in reports]
+                for future in futures:
+                    future.result()
         
         print("Analysis complete! All reports saved as PNG files.")
 
@@ -512,6 +876,11 @@ def main():
     """
     Main function to run the JIRA Analytics tool.
     """
+    arg_parser = argparse.ArgumentParser(description='Generate analytical reports for a JIRA project.')
+    arg_parser.add_argument('--refresh', action='store_true',
+                            help='ignore the cached issues and fetch them from JIRA again')
+    args = arg_parser.parse_args()
+    
     # Configuration - these should be set based on your JIRA instance
     jira_url = os.getenv('JIRA_URL', 'https://issues.apache.org/jira')
     username = os.getenv('JIRA_USERNAME', '')  # Not typically used with API tokens
@@ -530,7 +899,7 @@ def main():
     project_key = os.getenv('JIRA_PROJECT_KEY', 'KAFKA')
     
     try:
-        jira_analytics.run_full_analysis(project_key)
+        jira_analytics.run_full_analysis(project_key, refresh=args.refresh)
     except Exception as e:
         print(f"Error during analysis: {e}")
         sys.exit(1)
@@ -14,7 +14,7 @@ fi
 
 # Check if required packages are installed
 echo "Checking required packages..."
-python3 -c "import requests, pandas, matplotlib, seaborn, numpy, dateutil" 2>/dev/null
+python3 -c "import requests, pandas, matplotlib, numpy, numba, orjson, pyarrow" 2>/dev/null
 if [ $? -ne 0 ]; then
     echo "Required packages not found. Installing from requirements.txt..."
     pip3 install -r requirements.txt
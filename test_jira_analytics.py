@@ -1,14 +1,74 @@
 #!/usr/bin/env python3
 """
-Simple test file to verify the JIRA Analytics module structure.
+Simple test file to verify the JIRA Analytics module structure and that the
+compiled time-in-status kernel agrees with the per-issue calculation.
 """
 
 import sys
 import os
+import math
+import random
+from datetime import datetime, timezone
 
 # Add the workspace directory to the Python path
 sys.path.insert(0, '/workspace')
 
+
+def _make_test_issues():
+    """Build issues covering no transitions, empty and missing status names, and closing."""
+    rng = random.Random(0)
+    statuses = ['Open', 'In Progress', 'Review', 'Resolved', 'Closed', '']
+    issues = []
+    for i in range(50):
+        created = 1_700_000_000 + rng.randint(0, 10**6)
+        t = created
+        histories = []
+        # Every fifth issue has no transitions at all
+        for _ in range(0 if i % 5 == 0 else rng.randint(1, 6)):
+            t += rng.randint(60, 10**6)
+            histories.append({
+                'created': _jira_timestamp(t),
+                'author': {'displayName': 'Tester'},
+                'items': [{
+                    'field': 'status',
+                    # JIRA leaves fromString unset for some imported transitions
+                    'fromString': rng.choice(statuses + [None]),
+                    'toString': rng.choice(statuses)
+                }]
+            })
+        last_status = histories[-1]['items'][0]['toString'] if histories else 'Open'
+        issues.append({
+            'key': f'TEST-{i}',
+            'changelog': {'histories': histories},
+            'fields': {
+                'created': _jira_timestamp(created),
+                'updated': _jira_timestamp(t + rng.randint(0, 10**6)),
+                'status': {'name': last_status}
+            }
+        })
+    return issues
+
+
+def _jira_timestamp(seconds):
+    """Format epoch seconds the way JIRA does, e.g. 2024-01-02T15:04:05.000+0000."""
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000+0000')
+
+
+def test_time_in_status_matrix_matches_per_issue():
+    """calculate_time_in_status_matrix must agree with calculate_time_in_status for every issue."""
+    analytics = JiraAnalytics('https://jira.example.com', 'user', 'token')
+    issues = _make_test_issues()
+    matrix, status_names = analytics.calculate_time_in_status_matrix(analytics._issues_to_dataframe(issues))
+    assert matrix.shape == (len(issues), len(status_names))
+    assert '' not in status_names and None not in status_names
+    
+    for row, issue in zip(matrix, issues):
+        expected = analytics.calculate_time_in_status(issue)
+        actual = {name: days for name, days in zip(status_names, row) if not math.isnan(days)}
+        assert actual.keys() == expected.keys(), issue['key']
+        for name, days in expected.items():
+            assert math.isclose(actual[name], days, rel_tol=1e-9, abs_tol=1e-9), (issue['key'], name)
+
 try:
     from jira_analytics import JiraAnalytics
     print("✓ Successfully imported JiraAnalytics class")
@@ -60,4 +120,11 @@ try:
 except ImportError as e:
     print(f"✗ Failed to import JiraAnalytics: {e}")
 except Exception as e:
-    print(f"✗ Error during testing: {e}")
\ No newline at end of file
+    print(f"✗ Error during testing: {e}")
+
+if __name__ == '__main__':
+    try:
+        test_time_in_status_matrix_matches_per_issue()
+        print("✓ Time in status matrix matches the per-issue calculation")
+    except AssertionError as e:
+        print(f"✗ Time in status matrix differs from the per-issue calculation: {e}")
\ No newline at end of file